@@ -4,14 +4,195 @@ Simple Port Scanner
 A basic Python-based network port scanner for educational and legitimate security testing purposes.
 """
 
+import asyncio
+import errno
+import functools
+import heapq
+import io
+import itertools
+import multiprocessing
+import select
+import selectors
 import socket
+import struct
 import threading
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# connect_ex() results meaning a non-blocking connect is still in progress
+CONNECT_PENDING = {errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, "WSAEWOULDBLOCK", errno.EWOULDBLOCK)}
+
+# Descriptors kept free for stdio, the poller and anything else the process holds
+FD_HEADROOM = 64
+
+# SO_LINGER with l_onoff=1, l_linger=0: close() sends RST and skips TIME_WAIT
+LINGER_RST = struct.pack("HH" if sys.platform == "win32" else "ii", 1, 0)
+
+# Linux bounds a blocking connect() by SO_SNDTIMEO, so the kernel can enforce the
+# probe deadline without settimeout()'s non-blocking mode and poll() round trip
+KERNEL_CONNECT_TIMEOUT = sys.platform.startswith("linux") and hasattr(socket, "SO_SNDTIMEO")
+
+# Linux can create a non-blocking socket in the socket() call itself, saving the
+# follow-up ioctl that setblocking(False) issues (Python already adds SOCK_CLOEXEC)
+SOCK_NONBLOCK = getattr(socket, "SOCK_NONBLOCK", 0)
+
+# Lower bound for the adaptive probe timeout, in seconds
+MIN_PROBE_TIMEOUT = 0.05
+
+# False on a free-threaded build (e.g. python3.13t) running without the GIL
+GIL_ENABLED = getattr(sys, "_is_gil_enabled", lambda: True)()
+
+def timeval(seconds):
+    """
+    Pack a timeout as a struct timeval for SO_SNDTIMEO/SO_RCVTIMEO
+    
+    Args:
+        seconds (float): Timeout in seconds
+        
+    Returns:
+        bytes: Packed struct timeval, or None if it would round to zero,
+            which SO_SNDTIMEO treats as "no timeout"
+    """
+    sec, usec = int(seconds), int((seconds % 1) * 1e6)
+    if not sec and not usec:
+        return None
+    return struct.pack("ll", sec, usec)
+
+def socket_budget(requested):
+    """
+    Cap a socket window so it fits under the process's open-file limit
+    
+    Args:
+        requested (int): Desired number of sockets open at once
+        
+    Returns:
+        int: Number of sockets that can be opened, at least 1
+    """
+    if resource is None:
+        return requested
+    soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if soft == resource.RLIM_INFINITY:
+        return requested
+    return max(1, min(requested, soft - FD_HEADROOM))
+
+@functools.lru_cache(maxsize=1024)
+def resolve_host(host):
+    """
+    Resolve a hostname to an address, preferring IPv4 over IPv6
+    
+    Results are cached so repeated scans of the same target skip DNS.
+    
+    Args:
+        host (str): IP address or hostname
+        
+    Returns:
+        tuple: (address family, IP address)
+    
+    Raises:
+        socket.gaierror: If hostname cannot be resolved
+    """
+    addresses = {}
+    for family, _, _, _, sockaddr in socket.getaddrinfo(host, None, type=socket.SOCK_STREAM):
+        addresses.setdefault(family, sockaddr[0])
+    
+    if socket.AF_INET in addresses:
+        return socket.AF_INET, addresses[socket.AF_INET]
+    if socket.has_ipv6 and socket.AF_INET6 in addresses:
+        return socket.AF_INET6, addresses[socket.AF_INET6]
+    raise socket.gaierror(f"No usable address for {host}")
+
+class WritePoller:
+    """
+    Wait for pending connects to complete on many sockets with one syscall
+    
+    Uses an edge-triggered epoll set directly where available, so each socket
+    costs one epoll_ctl() to add and closing it removes it from the set for free.
+    Other platforms fall back to selectors.DefaultSelector.
+    """
+    
+    def __init__(self):
+        self.ports = {}  # fd -> port
+        if hasattr(select, "epoll"):
+            self.epoll = select.epoll()
+            self.selector = None
+        else:
+            self.epoll = None
+            self.selector = selectors.DefaultSelector()
+    
+    def register(self, sock, port):
+        """
+        Watch a socket with a connect in progress
+        
+        Args:
+            sock (socket.socket): Non-blocking socket
+            port (int): Port the socket is connecting to
+        """
+        fd = sock.fileno()
+        self.ports[fd] = port
+        if self.epoll:
+            self.epoll.register(fd, select.EPOLLOUT | select.EPOLLET)
+        else:
+            self.selector.register(fd, selectors.EVENT_WRITE)
+    
+    def unregister(self, sock):
+        """
+        Stop watching a socket that is about to be closed
+        
+        Args:
+            sock (socket.socket): Previously registered socket
+        """
+        fd = sock.fileno()
+        del self.ports[fd]
+        # epoll drops the fd by itself when the socket is closed
+        if self.selector:
+            self.selector.unregister(fd)
+    
+    def poll(self, timeout):
+        """
+        Wait until at least one connect completes or the timeout expires
+        
+        Args:
+            timeout (float): Maximum seconds to wait
+            
+        Returns:
+            list: Ports whose connect attempt has completed
+        """
+        if self.epoll:
+            return [self.ports[fd] for fd, _ in self.epoll.poll(timeout)]
+        return [self.ports[key.fd] for key, _ in self.selector.select(timeout)]
+    
+    def close(self):
+        """
+        Release the underlying epoll or selector object
+        """
+        if self.epoll:
+            self.epoll.close()
+        else:
+            self.selector.close()
+
 class PortScanner:
-    def __init__(self, target, start_port=1, end_port=1024, timeout=1, max_threads=100):
+    # Common service mappings
+    SERVICE_MAP = {
+        20: "FTP-DATA", 21: "FTP", 22: "SSH", 23: "TELNET", 25: "SMTP",
+        53: "DNS", 69: "TFTP", 80: "HTTP", 110: "POP3", 119: "NNTP",
+        123: "NTP", 143: "IMAP", 161: "SNMP", 194: "IRC", 443: "HTTPS",
+        993: "IMAPS", 995: "POP3S", 3389: "RDP", 5432: "PostgreSQL",
+        3306: "MySQL", 1521: "Oracle", 1433: "MSSQL", 6379: "Redis",
+        27017: "MongoDB", 5672: "RabbitMQ", 9200: "Elasticsearch"
+    }
+    
+    # Service name for every port, indexed directly instead of hashed
+    SERVICE_LUT = tuple(map(SERVICE_MAP.get, range(65536), ("Unknown",) * 65536))
+    
+    def __init__(self, target, start_port=1, end_port=1024, timeout=0.5, max_threads=100,
+                 max_concurrent=500, batch_size=1024, adaptive_timeout=True, processes=None):
         """
         Initialize the port scanner
         
@@ -19,31 +200,55 @@ class PortScanner:
             target (str): Target IP address or hostname
             start_port (int): Starting port number
             end_port (int): Ending port number
-            timeout (int): Connection timeout in seconds
+            timeout (float): Connection timeout in seconds, or None to block
             max_threads (int): Maximum number of threads for concurrent scanning
+            max_concurrent (int): Maximum number of in-flight connections for async scanning
+                (capped below the open-file limit)
+            batch_size (int): Maximum number of open sockets for selector scanning
+                (capped below the open-file limit)
+            adaptive_timeout (bool): Shrink the timeout to a few round trips once
+                an open port has been measured
+            processes (int): Number of worker processes for multiprocess scanning
+                (defaults to the CPU count)
         """
         self.target = target
         self.start_port = start_port
         self.end_port = end_port
         self.timeout = timeout
         self.max_threads = max_threads
-        self.open_ports = []
-        self.lock = threading.Lock()
-        
-        # Common service mappings
-        self.service_map = {
-            20: "FTP-DATA", 21: "FTP", 22: "SSH", 23: "TELNET", 25: "SMTP",
-            53: "DNS", 69: "TFTP", 80: "HTTP", 110: "POP3", 119: "NNTP",
-            123: "NTP", 143: "IMAP", 161: "SNMP", 194: "IRC", 443: "HTTPS",
-            993: "IMAPS", 995: "POP3S", 3389: "RDP", 5432: "PostgreSQL",
-            3306: "MySQL", 1521: "Oracle", 1433: "MSSQL", 6379: "Redis",
-            27017: "MongoDB", 5672: "RabbitMQ", 9200: "Elasticsearch"
-        }
+        self.max_concurrent = max_concurrent
+        self.batch_size = batch_size
+        self.adaptive_timeout = adaptive_timeout
+        self.processes = processes or multiprocessing.cpu_count()
+        self.rtt_lock = threading.Lock()
+        self.reset_timeout()
+        self.target_family = socket.AF_INET
+        self.open_map = bytearray(65536)  # index = port, 1 = open
+    
+    @property
+    def open_ports(self):
+        """
+        Open ports found by the last scan, in port order
+        
+        Returns:
+            list: (port, service) tuples
+        """
+        # find() jumps between set bytes with memchr, so only open ports reach Python
+        find, stop = self.open_map.find, self.end_port + 1
+        service_lut = self.SERVICE_LUT
+        open_ports = []
+        port = find(1, self.start_port, stop)
+        while port != -1:
+            open_ports.append((port, service_lut[port]))
+            port = find(1, port + 1, stop)
+        return open_ports
     
     def resolve_target(self):
         """
         Resolve hostname to IP address and validate target
         
+        Also records the address family (IPv4 or IPv6) in target_family.
+        
         Returns:
             str: Resolved IP address
         
@@ -51,16 +256,97 @@ class PortScanner:
             socket.gaierror: If hostname cannot be resolved
         """
         try:
-            ip = socket.gethostbyname(self.target)
+            self.target_family, ip = resolve_host(self.target)
             print(f"Resolved {self.target} to {ip}")
             return ip
         except socket.gaierror:
             raise socket.gaierror(f"Unable to resolve hostname: {self.target}")
     
+    def reset_timeout(self):
+        """
+        Forget measured round trips and probe with the configured timeout again
+        """
+        self.rtt = None
+        self.set_probe_timeout(self.timeout)
+    
+    def set_probe_timeout(self, timeout):
+        """
+        Set the timeout used by subsequent probes
+        
+        Args:
+            timeout (float): Timeout in seconds, or None to block
+        """
+        self.probe_timeout = timeout
+        # SO_SNDTIMEO can only express a finite timeout
+        self.probe_tv = timeval(timeout) if KERNEL_CONNECT_TIMEOUT and timeout is not None else None
+    
+    def record_rtt(self, rtt):
+        """
+        Fold a measured connect time into the round-trip estimate
+        
+        Closed ports answer with a reset within one round trip, so only filtered
+        ports wait out the probe timeout; with adaptive_timeout enabled it is
+        lowered to max(3 * rtt, MIN_PROBE_TIMEOUT), never above the configured
+        timeout (a timeout of None counts as unbounded).
+        
+        Args:
+            rtt (float): Seconds taken by a successful connect
+        """
+        # Threaded workers share this state; only open ports get here, so the lock is cheap
+        with self.rtt_lock:
+            self.rtt = rtt if self.rtt is None else 0.9 * self.rtt + 0.1 * rtt
+            if self.adaptive_timeout:
+                timeout = max(3 * self.rtt, MIN_PROBE_TIMEOUT)
+                if self.timeout is not None:
+                    timeout = min(self.timeout, timeout)
+                self.set_probe_timeout(timeout)
+    
+    def make_prober(self):
+        """
+        Build a port probe with the target and socket settings bound to locals
+        
+        Attribute lookups are resolved once here instead of on every port,
+        which matters on the hot path of large scans.
+        
+        Returns:
+            callable: Function taking a port number and returning True if it is open
+        """
+        sock_cls, af, st = socket.socket, self.target_family, socket.SOCK_STREAM
+        sol_socket, so_linger = socket.SOL_SOCKET, socket.SO_LINGER
+        so_sndtimeo = getattr(socket, "SO_SNDTIMEO", None)
+        ip, perf_counter, record_rtt = self.target_ip, time.perf_counter, self.record_rtt
+        scanner = self  # probe timeout can shrink while the scan runs
+        
+        def probe(port):
+            try:
+                sock = sock_cls(af, st)
+                tv = scanner.probe_tv
+                if KERNEL_CONNECT_TIMEOUT and tv:
+                    sock.setsockopt(sol_socket, so_sndtimeo, tv)
+                else:
+                    sock.settimeout(scanner.probe_timeout)
+                
+                # Connection successful if result is 0
+                started = perf_counter()
+                result = sock.connect_ex((ip, port))
+                if result == 0:
+                    record_rtt(perf_counter() - started)
+                    sock.setsockopt(sol_socket, so_linger, LINGER_RST)
+                sock.close()
+                return result == 0
+            
+            except socket.error:
+                return False
+        
+        return probe
+    
     def scan_port(self, port):
         """
         Scan a single port
         
+        Uses the current probe timeout but, unlike the scan methods, does not
+        feed the adaptive round-trip estimate.
+        
         Args:
             port (int): Port number to scan
             
@@ -69,32 +355,23 @@ class PortScanner:
         """
         try:
             # Create socket object
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(self.timeout)
+            sock = socket.socket(self.target_family, socket.SOCK_STREAM)
+            tv = self.probe_tv
+            if KERNEL_CONNECT_TIMEOUT and tv:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDTIMEO, tv)
+            else:
+                sock.settimeout(self.probe_timeout)
             
-            # Attempt connection
+            # Connection successful if result is 0
             result = sock.connect_ex((self.target_ip, port))
+            if result == 0:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RST)
             sock.close()
-            
-            # Connection successful if result is 0
             return result == 0
             
         except socket.error:
             return False
     
-    def threaded_scan(self, port):
-        """
-        Thread worker function for scanning ports
-        
-        Args:
-            port (int): Port number to scan
-        """
-        if self.scan_port(port):
-            service = self.service_map.get(port, "Unknown")
-            with self.lock:
-                self.open_ports.append((port, service))
-                print(f"Port {port}/tcp open - {service}")
-    
     def scan_sequential(self):
         """
         Perform sequential port scanning (single-threaded)
@@ -104,12 +381,12 @@ class PortScanner:
         print("-" * 50)
         
         start_time = time.time()
+        probe = self.make_prober()
+        open_map = self.open_map
         
         for port in range(self.start_port, self.end_port + 1):
-            if self.scan_port(port):
-                service = self.service_map.get(port, "Unknown")
-                self.open_ports.append((port, service))
-                print(f"Port {port}/tcp open - {service}")
+            if probe(port):
+                open_map[port] = 1
         
         end_time = time.time()
         print(f"\nSequential scan completed in {end_time - start_time:.2f} seconds")
@@ -119,72 +396,312 @@ class PortScanner:
         Perform multithreaded port scanning
         """
         print(f"\nStarting threaded scan on {self.target_ip}")
-        print(f"Scanning ports {self.start_port}-{self.end_port} with {self.max_threads} threads")
+        print(f"Scanning ports {self.start_port}-{self.end_port} with {self.max_threads} threads"
+              + ("" if GIL_ENABLED else " (free-threaded)"))
         print("-" * 50)
         
         start_time = time.time()
-        threads = []
+        probe = self.make_prober()
+        open_map = self.open_map
+        # Admit at most max_threads ports at a time instead of queueing a future per port
+        admission = threading.BoundedSemaphore(self.max_threads)
+        errors = []  # futures are not kept, so worker exceptions are collected here
         
-        # Create and start threads
-        for port in range(self.start_port, self.end_port + 1):
-            # Limit concurrent threads
-            while len([t for t in threads if t.is_alive()]) >= self.max_threads:
-                time.sleep(0.01)
-            
-            thread = threading.Thread(target=self.threaded_scan, args=(port,))
-            thread.start()
-            threads.append(thread)
+        # Each worker writes only its own port's byte of open_map, so the bitmap
+        # needs no lock, with or without the GIL; the shared RTT estimate is
+        # updated under rtt_lock inside record_rtt()
+        def worker(port):
+            try:
+                if probe(port):
+                    open_map[port] = 1
+            except Exception as e:
+                errors.append(e)
+            finally:
+                admission.release()
+        
+        with ThreadPoolExecutor(max_workers=self.max_threads) as executor:
+            for port in range(self.start_port, self.end_port + 1):
+                admission.acquire()
+                if errors:
+                    break
+                executor.submit(worker, port)
         
-        # Wait for all threads to complete
-        for thread in threads:
-            thread.join()
+        if errors:
+            raise errors[0]
         
         end_time = time.time()
         print(f"\nThreaded scan completed in {end_time - start_time:.2f} seconds")
     
+    def scan_selector(self):
+        """
+        Perform selector-based port scanning (non-blocking connects, single thread)
+        """
+        print(f"\nStarting selector scan on {self.target_ip}")
+        print(f"Scanning ports {self.start_port}-{self.end_port} in windows of {self.batch_size} sockets")
+        print("-" * 50)
+        
+        start_time = time.time()
+        self.probe_selector()
+        end_time = time.time()
+        print(f"\nSelector scan completed in {end_time - start_time:.2f} seconds")
+    
+    def probe_selector(self):
+        """
+        Probe the port range with non-blocking connects and mark open ports
+        
+        All in-flight sockets share one WritePoller (epoll on Linux) for the whole scan.
+        """
+        poller = WritePoller()
+        ports = iter(range(self.start_port, self.end_port + 1))
+        pending = {}     # port -> (socket, start time) with a connect in flight
+        started_at = []  # heap of (start time, port); deadline = start + probe_timeout
+        open_map = self.open_map
+        window = socket_budget(self.batch_size)
+        
+        try:
+            while True:
+                # Keep the window full of in-flight connects
+                while len(pending) < window:
+                    port = next(ports, None)
+                    if port is None:
+                        break
+                    try:
+                        sock = socket.socket(self.target_family, socket.SOCK_STREAM | SOCK_NONBLOCK)
+                    except OSError as e:
+                        if e.errno not in (errno.EMFILE, errno.ENFILE) or not pending:
+                            raise
+                        # Out of descriptors: shrink the window and retry this port after polling
+                        window = len(pending)
+                        ports = itertools.chain((port,), ports)
+                        break
+                    if not SOCK_NONBLOCK:
+                        sock.setblocking(False)
+                    started = time.monotonic()
+                    err = sock.connect_ex((self.target_ip, port))
+                    if err in CONNECT_PENDING:
+                        poller.register(sock, port)
+                        pending[port] = (sock, started)
+                        heapq.heappush(started_at, (started, port))
+                    else:
+                        if err == 0:
+                            open_map[port] = 1
+                            sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RST)
+                        sock.close()
+                
+                if not pending:
+                    break
+                
+                # Drop entries of probes that already completed
+                while started_at[0][1] not in pending:
+                    heapq.heappop(started_at)
+                
+                # Deadlines follow probe_timeout, so in-flight probes tighten with it too
+                timeout = self.probe_timeout
+                wait = None if timeout is None else max(0.0, started_at[0][0] + timeout - time.monotonic())
+                for port in poller.poll(wait):
+                    sock, started = pending.pop(port)
+                    poller.unregister(sock)
+                    if sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        self.record_rtt(time.monotonic() - started)
+                        open_map[port] = 1
+                        sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RST)
+                    sock.close()
+                
+                # Expire probes that ran out of time
+                if self.probe_timeout is None:
+                    continue
+                expired = time.monotonic() - self.probe_timeout
+                while started_at and started_at[0][0] <= expired:
+                    _, port = heapq.heappop(started_at)
+                    sock, _ = pending.pop(port, (None, None))
+                    if sock is not None:
+                        poller.unregister(sock)
+                        sock.close()
+        finally:
+            for sock, _ in pending.values():
+                sock.close()
+            poller.close()
+    
+    def scan_processes(self):
+        """
+        Perform port scanning sharded across worker processes
+        
+        The range is split into one contiguous chunk per process, and each
+        process runs a selector scan over its chunk, so the Python-level work
+        runs in parallel instead of contending for one interpreter's GIL.
+        """
+        port_count = self.end_port - self.start_port + 1
+        processes = max(1, min(self.processes, port_count))
+        print(f"\nStarting multiprocess scan on {self.target_ip}")
+        print(f"Scanning ports {self.start_port}-{self.end_port} with {processes} processes")
+        print("-" * 50)
+        
+        start_time = time.time()
+        
+        # An empty range has nothing to shard; report no ports like the other methods
+        if port_count > 0:
+            # Split the socket budget so the target sees the same load as a selector scan
+            batch_size = max(1, self.batch_size // processes)
+            chunk = -(-port_count // processes)
+            jobs = [(self.target_ip, self.target_family, start, min(start + chunk - 1, self.end_port),
+                     self.timeout, batch_size, self.adaptive_timeout)
+                    for start in range(self.start_port, self.end_port + 1, chunk)]
+            
+            # Progress is reported per finished chunk, since run() starts no
+            # reporter thread for this method
+            with multiprocessing.Pool(processes) as pool:
+                for done, open_ports in enumerate(pool.imap_unordered(scan_chunk_job, jobs), 1):
+                    for port in open_ports:
+                        self.open_map[port] = 1
+                    print(f"... {done}/{len(jobs)} chunks done, "
+                          f"{self.open_map.count(1)} open ports found so far")
+        
+        end_time = time.time()
+        print(f"\nMultiprocess scan completed in {end_time - start_time:.2f} seconds")
+    
+    async def _ascan(self, port, sem):
+        """
+        Coroutine that scans a single port
+        
+        Args:
+            port (int): Port number to scan
+            sem (asyncio.Semaphore): Semaphore bounding in-flight connections
+            
+        Returns:
+            bool: True if port is open, False otherwise
+        """
+        async with sem:
+            try:
+                started = time.perf_counter()
+                fut = asyncio.open_connection(self.target_ip, port)
+                reader, writer = await asyncio.wait_for(fut, self.probe_timeout)
+                self.record_rtt(time.perf_counter() - started)
+                writer.get_extra_info("socket").setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, LINGER_RST)
+                writer.close()
+                await writer.wait_closed()
+                return True
+            except asyncio.TimeoutError:
+                return False
+            except OSError as e:
+                # Running out of descriptors says nothing about the port
+                if e.errno in (errno.EMFILE, errno.ENFILE):
+                    raise
+                return False
+    
+    async def _scan_ports_async(self):
+        """
+        Probe the whole port range concurrently on a single event loop
+        
+        Returns:
+            list: Open/closed flag for each port in the range
+        """
+        sem = asyncio.Semaphore(socket_budget(self.max_concurrent))
+        tasks = [self._ascan(port, sem) for port in range(self.start_port, self.end_port + 1)]
+        return await asyncio.gather(*tasks)
+    
+    def scan_async(self):
+        """
+        Perform asynchronous port scanning (single thread, asyncio event loop)
+        """
+        print(f"\nStarting async scan on {self.target_ip}")
+        print(f"Scanning ports {self.start_port}-{self.end_port} with {socket_budget(self.max_concurrent)} concurrent connections")
+        print("-" * 50)
+        
+        start_time = time.time()
+        
+        results = asyncio.run(self._scan_ports_async())
+        for port, is_open in zip(range(self.start_port, self.end_port + 1), results):
+            if is_open:
+                self.open_map[port] = 1
+        
+        end_time = time.time()
+        print(f"\nAsync scan completed in {end_time - start_time:.2f} seconds")
+    
+    def report_progress(self, stop, interval=1.0):
+        """
+        Periodically print how many open ports have been found so far
+        
+        Runs in a background thread so scan workers never touch stdout.
+        
+        Args:
+            stop (threading.Event): Event that ends reporting when set
+            interval (float): Seconds between progress lines
+        """
+        while not stop.wait(interval):
+            print(f"... {self.open_map.count(1)} open ports found so far")
+    
     def print_results(self):
         """
         Print scan results summary
+        
+        The report is assembled in memory and written to stdout in one call.
         """
-        print("\n" + "="*60)
-        print("SCAN RESULTS SUMMARY")
-        print("="*60)
+        buf = io.StringIO()
+        print("\n" + "="*60, file=buf)
+        print("SCAN RESULTS SUMMARY", file=buf)
+        print("="*60, file=buf)
         
-        if self.open_ports:
-            # Sort ports by number
-            self.open_ports.sort(key=lambda x: x[0])
+        open_ports = self.open_ports
+        if open_ports:
+            print(f"Host: {self.target} ({self.target_ip})", file=buf)
+            print(f"Open ports found: {len(open_ports)}", file=buf)
+            print("\nPORT\tSTATE\tSERVICE", file=buf)
+            print("-" * 30, file=buf)
             
-            print(f"Host: {self.target} ({self.target_ip})")
-            print(f"Open ports found: {len(self.open_ports)}")
-            print("\nPORT\tSTATE\tSERVICE")
-            print("-" * 30)
-            
-            for port, service in self.open_ports:
-                print(f"{port}/tcp\topen\t{service}")
+            # One join over a fixed format instead of a print() per port
+            buf.write("\n".join(["%d/tcp\topen\t%s" % row for row in open_ports]))
+            buf.write("\n")
         else:
-            print(f"No open ports found on {self.target} ({self.target_ip})")
+            print(f"No open ports found on {self.target} ({self.target_ip})", file=buf)
         
-        print("="*60)
+        print("="*60, file=buf)
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
     
-    def run(self, use_threading=True):
+    def run(self, use_threading=True, method=None):
         """
         Main scanning function
         
         Args:
             use_threading (bool): Whether to use multithreaded scanning
+            method (str): Scan method ("sequential", "threaded", "async", "selector" or
+                "process"); overrides use_threading when given
         """
+        scanners = {
+            "sequential": self.scan_sequential,
+            "threaded": self.scan_threaded,
+            "async": self.scan_async,
+            "selector": self.scan_selector,
+            "process": self.scan_processes,
+        }
+        if method is None:
+            method = "threaded" if use_threading else "sequential"
+        if method not in scanners:
+            raise ValueError(f"Unknown scan method: {method}")
+        
         try:
             # Resolve target
             self.target_ip = self.resolve_target()
             
             # Clear previous results
-            self.open_ports = []
+            self.open_map = bytearray(65536)
+            self.reset_timeout()
             
-            # Perform scan
-            if use_threading:
-                self.scan_threaded()
-            else:
-                self.scan_sequential()
+            # Perform scan, reporting progress from a background thread. The
+            # multiprocess scan reports its own progress: its Pool must not fork
+            # while the reporter thread runs, and results only reach open_map
+            # as chunks finish
+            stop = threading.Event()
+            progress = None
+            if method != "process":
+                progress = threading.Thread(target=self.report_progress, args=(stop,), daemon=True)
+                progress.start()
+            try:
+                scanners[method]()
+            finally:
+                stop.set()
+                if progress:
+                    progress.join()
             
             # Print results
             self.print_results()
@@ -199,6 +716,40 @@ class PortScanner:
             print(f"Unexpected error: {e}")
             sys.exit(1)
 
+def scan_chunk(target_ip, family, start_port, end_port, timeout, batch_size, adaptive_timeout):
+    """
+    Worker for multiprocess scanning: probe one chunk of the port range
+    
+    Args:
+        target_ip (str): Resolved target IP address
+        family (int): Address family of target_ip
+        start_port (int): First port of the chunk
+        end_port (int): Last port of the chunk
+        timeout (float): Connection timeout in seconds
+        batch_size (int): Maximum number of open sockets in this process
+        adaptive_timeout (bool): Whether to adapt the timeout to the measured RTT
+        
+    Returns:
+        list: Open port numbers in the chunk
+    """
+    scanner = PortScanner(target_ip, start_port, end_port, timeout=timeout,
+                          batch_size=batch_size, adaptive_timeout=adaptive_timeout)
+    scanner.target_ip, scanner.target_family = target_ip, family
+    scanner.probe_selector()
+    return [port for port, _ in scanner.open_ports]
+
+def scan_chunk_job(job):
+    """
+    Unpack a job tuple for scan_chunk (Pool.imap_unordered passes one argument)
+    
+    Args:
+        job (tuple): Positional arguments for scan_chunk
+        
+    Returns:
+        list: Open port numbers in the chunk
+    """
+    return scan_chunk(*job)
+
 def main():
     """
     Main function with user interaction
@@ -232,14 +783,15 @@ def main():
             start_port, end_port = 1, 1024
         
         # Get scan method
-        method = input("Use threading? (y/n, default y): ").strip().lower()
-        use_threading = method != 'n'
+        method = input("Scan method (async/selector/process/threaded/sequential, default async): ").strip().lower()
+        if method not in ("async", "selector", "process", "threaded", "sequential"):
+            method = "async"
         
         # Create and run scanner
         scanner = PortScanner(target, start_port, end_port)
         
         print(f"\nStarting scan at {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        scanner.run(use_threading)
+        scanner.run(method=method)
         
     except KeyboardInterrupt:
         print("\nProgram interrupted by user")